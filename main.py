@@ -10,6 +10,12 @@ from tarsiflow.datatypes import (
     Array
 )
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # `numba` is optional; the pure numpy paths below are used without it
+    njit = None
+
 
 @with_model_context
 def compute_aal(
@@ -19,21 +25,89 @@ def compute_aal(
     return avg_severity * avg_n_claims
 
 
+if njit is not None:
+
+    # Opt-in alternative to the closed-form sampler in `compute_trial_losses` (swap 
+    # `compute_trial_losses_by_claim` into the schema to use it) - it draws from different streams, 
+    # so the two do not agree sample for sample, even under the same seed
+    @njit(parallel=True, cache=True, fastmath=True)
+    def simulate_trial_losses(
+        seeds: np.ndarray,
+        avg_n_claims: float,
+        avg_severity: float,
+        n_trials: int
+    ) -> np.ndarray:
+        # Claim-by-claim simulation compiled to machine code (and spread across threads) - keeps
+        # the per-trial structure available should individual claim amounts be required. Each
+        # block of trials is drawn from its own seeded stream, so results do not depend on how 
+        # blocks are scheduled across threads. Losses are accumulated in double precision but 
+        # stored in single precision
+        trial_losses = np.empty(n_trials, dtype=np.float32)
+        block_size = (n_trials + seeds.shape[0] - 1) // seeds.shape[0]
+        for block in prange(seeds.shape[0]):
+            np.random.seed(seeds[block])
+            for i in range(block * block_size, min((block + 1) * block_size, n_trials)):
+                k = np.random.poisson(avg_n_claims)
+                total = 0.0
+                for _ in range(k):
+                    total += np.random.exponential(avg_severity)
+                trial_losses[i] = total
+        return trial_losses
+
+    @with_model_context
+    def compute_trial_losses_by_claim(
+        avg_severity: float,
+        avg_n_claims: float,
+        n_trials: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        return simulate_trial_losses(
+            rng.integers(2**32, size=64),
+            float(avg_n_claims),
+            float(avg_severity),
+            int(n_trials)
+        )
+
+    @njit(parallel=True, cache=True)
+    def layer_net_losses(
+        trial_losses: np.ndarray,
+        agg_excess: float,
+        agg_limit: float
+    ) -> np.ndarray:
+        # Single pass over `trial_losses` (NaN placeholders map to zero, as with `np.fmax`)
+        net_losses = np.empty_like(trial_losses)
+        for i in prange(trial_losses.shape[0]):
+            loss = trial_losses[i] - agg_excess
+            if not loss > 0.0:
+                loss = 0.0
+            elif loss > agg_limit:
+                loss = agg_limit
+            net_losses[i] = loss
+        return net_losses
+
+
 @with_model_context
 def compute_trial_losses(
     avg_severity: float,
     avg_n_claims: float,
-    n_trials: int
+    n_trials: int,
+    rng: np.random.Generator
 ) -> np.ndarray:
-    trial_frequencies = np.random.poisson(
+    trial_frequencies = rng.poisson(
         lam=avg_n_claims,
         size=n_trials
     )
-    trial_losses = np.array([
-        np.random.exponential(scale=avg_severity, size=k).sum()
-        for k in trial_frequencies
-    ])
-    return trial_losses
+
+    # The sum of `k` exponential claims is Gamma(k, avg_severity) distributed
+    trial_losses = np.where(
+        trial_frequencies > 0,
+        rng.gamma(
+            shape=np.maximum(trial_frequencies, 1),
+            scale=avg_severity
+        ),
+        0.0
+    )
+    return trial_losses.astype(np.float32, copy=False)
 
 
 @with_model_context
@@ -42,7 +116,25 @@ def compute_net_losses(
     agg_excess: float,
     agg_limit: float
 ) -> np.ndarray:
-    return np.fmin(np.fmax(trial_losses - agg_excess, 0), agg_limit)
+    # Both paths do their arithmetic in the (floating) dtype of `trial_losses`, so that results do
+    # not depend on whether `numba` is installed
+    dtype = np.result_type(trial_losses, 0.0)
+    trial_losses = np.asarray(trial_losses, dtype=dtype)
+    agg_excess = dtype.type(agg_excess)
+    agg_limit = dtype.type(agg_limit)
+
+    if njit is not None:
+        return layer_net_losses(
+            trial_losses,
+            agg_excess,
+            agg_limit
+        )
+
+    # Reuse the one temporary throughout rather than allocating three (`fmax` maps NaN placeholders 
+    # to zero)
+    net_losses = np.subtract(trial_losses, agg_excess)
+    np.fmax(net_losses, 0, out=net_losses)
+    return np.fmin(net_losses, agg_limit, out=net_losses)
     
 
 async def main():
@@ -64,11 +156,13 @@ async def main():
         Array(
             "trial_losses", 
             compute_trial_losses, 
-            from_task=True
+            from_task=True,
+            dtype=np.float32
         ),
         Array(
             "net_losses", 
-            compute_net_losses
+            compute_net_losses,
+            dtype=np.float32
         )
 
     ]
@@ -1,18 +1,28 @@
 import numpy as np
+from numpy.typing import DTypeLike
 from typing import Callable, Any
 
 
 class Field:
 
+    __slots__ = ("compute", "from_task", "persist", "lazy", "memoise", "sentinel", "_name", "_value", "_observer")
+
     def __init__(
         self, 
         name: str, 
         compute: Callable | None = None,
-        from_task: bool = False
+        from_task: bool = False,
+        persist: bool = False,
+        lazy: bool = False,
+        memoise: bool = False
     ):
         self.compute = compute
         self.from_task = from_task
+        self.persist = persist
+        self.lazy = lazy
+        self.memoise = memoise
         self.name = name
+        self._observer: Callable[["Field"], None] | None = None
 
     @property
     def name(self):
@@ -21,21 +31,45 @@ class Field:
     @name.setter
     def name(self, new_value: str):
         self._name = new_value.lower()
+
+    def _write(self, new_value: Any) -> None:
+        """
+        Store an (already coerced) `new_value`, notifying the model that the field is registered to 
+        (if any) - so that its own store never disagrees with the field
+        """
+        self._value = new_value
+        if self._observer is not None:
+            self._observer(self)
+
+    def convert(self, new_value: Any) -> Any:
+        """
+        Coerce `new_value` to the type held by this field (as its `value` setter would, but without 
+        copying where that can be avoided)
+        """
+        return new_value
         
 
 class Float(Field):
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str, 
         compute: Callable | None = None,
         from_task: bool = False,
-        default_value: float | None = None
+        default_value: float | None = None,
+        persist: bool = False,
+        lazy: bool = False,
+        memoise: bool = False
     ):
         super().__init__(
             name=name,
             compute=compute,
-            from_task=from_task
+            from_task=from_task,
+            persist=persist,
+            lazy=lazy,
+            memoise=memoise
         )
         self.sentinel = float("nan")
         self.value = default_value
@@ -46,7 +80,10 @@ class Float(Field):
     
     @value.setter
     def value(self, new_value: float | None):
-        self._value = float(new_value) if new_value is not None else self.sentinel
+        self._write(self.convert(new_value))
+
+    def convert(self, new_value: float | None) -> float:
+        return float(new_value) if new_value is not None else self.sentinel
 
     def __repr__(self):
         return f"<Float {self.name}, value (float) = {self.value}>"
@@ -54,17 +91,25 @@ class Float(Field):
 
 class Integer(Field):
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str, 
         compute: Callable | None = None,
         from_task: bool = False,
-        default_value: int | None = None
+        default_value: int | None = None,
+        persist: bool = False,
+        lazy: bool = False,
+        memoise: bool = False
     ):
         super().__init__(
             name=name,
             compute=compute,
-            from_task=from_task
+            from_task=from_task,
+            persist=persist,
+            lazy=lazy,
+            memoise=memoise
         )
         self.sentinel = 0
         self.value = default_value
@@ -75,7 +120,10 @@ class Integer(Field):
     
     @value.setter
     def value(self, new_value: int | None):
-        self._value = int(new_value) if new_value is not None else self.sentinel
+        self._write(self.convert(new_value))
+
+    def convert(self, new_value: int | None) -> int:
+        return int(new_value) if new_value is not None else self.sentinel
 
     def __repr__(self):
         return f"<Integer {self.name}, value (int) = {self.value}>"
@@ -83,17 +131,25 @@ class Integer(Field):
 
 class String(Field):
 
+    __slots__ = ()
+
     def __init__(
         self,
         name: str, 
         compute: Callable | None = None,
         from_task: bool = False,
-        default_value: str | None = None
+        default_value: str | None = None,
+        persist: bool = False,
+        lazy: bool = False,
+        memoise: bool = False
     ):
         super().__init__(
             name=name,
             compute=compute,
-            from_task=from_task
+            from_task=from_task,
+            persist=persist,
+            lazy=lazy,
+            memoise=memoise
         )
         self.sentinel = ""
         self.value = default_value
@@ -104,7 +160,10 @@ class String(Field):
     
     @value.setter
     def value(self, new_value: str | None):
-        self._value = str(new_value) if new_value is not None else self.sentinel
+        self._write(self.convert(new_value))
+
+    def convert(self, new_value: str | None) -> str:
+        return str(new_value) if new_value is not None else self.sentinel
 
     def __repr__(self):
         return f"<String {self.name}, value (str) = {self.value}>"
@@ -112,18 +171,28 @@ class String(Field):
 
 class Array(Field):
 
+    __slots__ = ("dtype",)
+
     def __init__(
         self,
         name: str, 
         compute: Callable | None = None,
         from_task: bool = False,
-        default_value: np.ndarray | None = None
+        default_value: np.ndarray | None = None,
+        persist: bool = False,
+        lazy: bool = False,
+        dtype: DTypeLike | None = None,
+        memoise: bool = False
     ):
         super().__init__(
             name=name,
             compute=compute,
-            from_task=from_task
+            from_task=from_task,
+            persist=persist,
+            lazy=lazy,
+            memoise=memoise
         )
+        self.dtype = dtype
         self.sentinel = np.array([np.nan])
         self.value = default_value
 
@@ -137,7 +206,10 @@ class Array(Field):
     
     @value.setter
     def value(self, new_value: np.ndarray | None):
-        self._value = np.array(new_value) if new_value is not None else self.sentinel
+        self._write(np.array(new_value, dtype=self.dtype) if new_value is not None else self.sentinel)
+
+    def convert(self, new_value: np.ndarray | None) -> np.ndarray:
+        return np.asarray(new_value, dtype=self.dtype) if new_value is not None else self.sentinel
 
     def __repr__(self):
         return f"<Array (float) {self.name}, length={self.length}>"
@@ -145,18 +217,26 @@ class Array(Field):
 
 class List(Field):
 
+    __slots__ = ("subclass",)
+
     def __init__(
         self,
         name: str, 
         compute: Callable | None = None,
         from_task: bool = False,
         default_value: list[Any] | None = None,
-        classifier: Callable = dict
+        classifier: Callable = dict,
+        persist: bool = False,
+        lazy: bool = False,
+        memoise: bool = False
     ):
         super().__init__(
             name=name,
             compute=compute,
-            from_task=from_task
+            from_task=from_task,
+            persist=persist,
+            lazy=lazy,
+            memoise=memoise
         )
         self.sentinel = list()
         self.subclass = classifier
@@ -172,7 +252,13 @@ class List(Field):
     
     @value.setter
     def value(self, new_value: list | None):
-        self._value = [self.subclass(**item) for item in new_value] if len(new_value) > 0 else self.sentinel
+        self._write(self.convert(new_value))
+
+    def convert(self, new_value: list | None) -> list:
+        # Items that are already classified are kept as they are (so that converting twice is harmless)
+        if len(new_value) == 0:
+            return self.sentinel
+        return [item if isinstance(item, self.subclass) else self.subclass(**item) for item in new_value]
 
     def __getitem__(self, index: int) -> Any:
         return self.value[index]
@@ -1,10 +1,17 @@
+import os
 import inspect
 import asyncio
+import hashlib
+import pickle
 import pprint
+import types
+import warnings
 import numpy as np
+from pathlib import Path
 from functools import wraps
-from collections import defaultdict, deque
-from typing import Any
+from graphlib import TopologicalSorter
+from collections import defaultdict, OrderedDict
+from typing import Any, Callable, Hashable
 from .tracking import Tracking
 from .datatypes import Field, Array
 
@@ -13,27 +20,103 @@ def with_model_context(func):
     """
     Inject `model` context (state) into key-value arguments at runtime.
     """
-    sig = inspect.signature(func)  
+    parameters = inspect.signature(func).parameters
+    param_names = tuple(parameters)
+    positional = all(
+        parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+        for parameter in parameters.values()
+    )
 
     @wraps(func)
     def wrapper(*args, **kwargs): 
         
         model = kwargs.pop("model", None)  
+        context = kwargs.pop("context", None)
+
         if model is not None:
-            for name in sig.parameters:  
-                if name not in kwargs:
-                    kwargs[name] = model.get(name)
+            if positional and not args and not kwargs:
+                # Fast path - every argument is drawn from the model
+                args = [model.get(name) for name in param_names]
+            else:
+                for name in param_names:  
+                    if name not in kwargs:
+                        kwargs[name] = model.get(name)
 
-        context = kwargs.pop("context", None)
         if context is not None:
             if context["from_task"]:
                 return context["sentinel"] 
 
         return func(*args, **kwargs)  
     
+    wrapper.param_names = param_names
+    wrapper.positional = positional
     return wrapper  
 
 
+_MISSING = object()
+_BLOCK_SIZE = 65_536
+
+
+def _hashable(value: Any) -> Hashable:
+    """
+    Reduce a field `value` to something hashable so that it may form part of a cache key - arrays
+    are summarised by their shape, dtype and a digest of their contents, and scalars are tagged by 
+    their type (floats by their exact representation, so that e.g. `0.0` and `-0.0` remain distinct). 
+    Object arrays are rejected, since their buffers hold references rather than contents. Note that
+    the elements of other containers (such as tuples) are hashed as they are
+    """
+    if isinstance(value, np.ndarray):
+        if value.dtype.hasobject:
+            raise TypeError("object arrays cannot be hashed by content")
+        digest = hashlib.blake2b(np.ascontiguousarray(value), digest_size=16).digest()
+        return (value.shape, value.dtype.str, digest)
+    if isinstance(value, (float, np.floating)):
+        return (type(value), float(value).hex())
+    hash(value)
+    return (type(value), value)
+
+
+def _frozen(value: Any) -> Any:
+    """
+    Take a read-only copy of an array `value` before it is memoised - results are handed back to the
+    client (in each `delta`), so cache entries must never share (writeable) memory with them. Hits
+    are handed out as writeable copies in turn (see `Model._cache_lookup`)
+    """
+    if isinstance(value, np.ndarray):
+        value = value.copy()
+        value.setflags(write=False)
+    return value
+
+
+def _fingerprint(func: Callable) -> str:
+    """
+    Identify a compute function by its qualified name and the contents of its own code object 
+    (bytecode, constants and the names it refers to, but not its file or line numbers) - so that 
+    persisted results are invalidated when the body of the function is edited, though not when it
+    is merely moved. Note that this does not extend to the helpers it calls, the globals it reads or
+    the values it closes over
+    """
+    func = inspect.unwrap(func)
+    digest = hashlib.sha256(f"{func.__module__}.{func.__qualname__}".encode())
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        _digest_code(digest, code)
+    return digest.hexdigest()
+
+
+def _digest_code(digest: Any, code: types.CodeType) -> None:
+    """
+    Feed the location-independent parts of `code` (and of any code nested within it) to `digest`
+    """
+    digest.update(code.co_code)
+    digest.update(repr((code.co_names, code.co_varnames, code.co_argcount, code.co_kwonlyargcount)).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _digest_code(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
 class Model:
     """
     Creates a 'model' for storing computational results and tracking computational dependencies.
@@ -54,16 +137,67 @@ class Model:
       In this instance, the input field `avg_severity` (which is decided by the client) is responsible 
       for the computation of the `aal` and `simulated_losses`. The same logic applies to `avg_n_claims`
     * In addition, a full list of fields registered to the model are available by calling on `Model.fields`
+    * Field values are mirrored in a flat, index-addressed store so that reads made by compute 
+      functions avoid a per-field attribute lookup. Registered fields write through to this store, 
+      so assigning to `Model.fields[name].value` is equivalent to calling `Model.set`
+    * Every write to a field bumps its version number. Outputs remember the versions of their upstream
+      dependencies at the time they were last evaluated, and are not recomputed when these are unchanged
+    * Results of fields declared with `memoise=True` are cached against the values of their upstream 
+      dependencies, so that flipping an input back to a previously seen value does not trigger a 
+      recompute. At most `cache_size` results are retained per field (`cache_size=0` disables this). 
+      Building a key means hashing every upstream value, so this only pays off where the compute is 
+      much more expensive than the hash (and each entry is held in memory)
+    * Compute functions that declare an `rng` parameter receive their own `np.random.Generator`,
+      spawned from `Model.rng` (seeded by `seed`) - so that concurrent computes never share a stream
+    * The dependencies of compute functions decorated by `with_model_context` are read from their 
+      signatures as soon as they are registered. Any other compute function is executed once (by 
+      `Model.initialise`) so that the fields it requests can be tracked
+    * Fields declared with `lazy=True` are skipped by `Model.initialise` and only computed (and wired
+      into the dependency graph) the first time they are requested via `Model.get`
+    * Results of fields declared with `persist=True` are additionally pickled to `cache_dir`, keyed by
+      the compute function and the values of its upstream dependencies, so that they survive restarts.
+      Only edits to the compute function's own body invalidate these - not edits to the helpers it 
+      calls, the globals it reads or the values it closes over (clear `cache_dir` after such changes)
     """
-    def __init__(self):
+    def __init__(
+        self, 
+        cache_size: int = 128, 
+        seed: int | None = None,
+        cache_dir: str | os.PathLike = ".tarsiflow_cache"
+    ):
         self._fields = {}
+        self._index: dict[str, int] = {}
+        self._values: list[Any] = []
+        self._versions: list[int] = []
         self._dependents = defaultdict(list)
+        self._upstream: dict[str, tuple[str, ...]] = {}
+        self._upstream_indices: dict[str, tuple[int, ...]] = {}
+        self._evaluated: dict[str, tuple[int, ...]] = {}
+        self._pending: set[str] = set()
+        self._declared: set[str] = set()
+        self._initialised = False
+        self._names: tuple[str, ...] = ()
+        self._successors: tuple[tuple[int, ...], ...] = ()
+        self._predecessors: tuple[tuple[int, ...], ...] = ()
+        self._rank: list[int] = []
+        self._depth: list[int] = []
+        self._cache: dict[str, OrderedDict] = defaultdict(OrderedDict)
+        self._cache_size = cache_size
+        self._cache_dir = Path(cache_dir)
+        self._fingerprints: dict[str, str] = {}
+        self._rng = np.random.default_rng(seed)
+        self._generators: dict[str, np.random.Generator] = {}
+        self._kernels: dict[str, Callable[[], Any]] = {}
         self._tracking: Tracking = Tracking()
 
     @property
     def fields(self):
         return self._fields
     
+    @property
+    def rng(self) -> np.random.Generator:
+        return self._rng
+    
     @property
     def dependents(self):
         return self._dependents
@@ -79,67 +213,418 @@ class Model:
         """
         self._fields[field.name] = field
 
+        if "rng" in getattr(field.compute, "param_names", ()):
+            self._generators[field.name] = self._rng.spawn(1)[0]
+
+        if field.persist:
+            if field.compute is None:
+                raise ValueError(f"Incorrect specification; '{field.name}' cannot be persisted without a compute")
+            self._fingerprints[field.name] = _fingerprint(field.compute)
+
+        param_names = getattr(field.compute, "param_names", None)
+        if param_names is not None and field.name not in self._declared:
+            dependencies = tuple(
+                name for name in param_names 
+                if name != "rng" or field.name not in self._generators
+            )
+            for dep in dependencies:
+                self._dependents[dep].append(field.name)
+            self._upstream[field.name] = dependencies
+            self._declared.add(field.name)
+
+        if field.name not in self._index:
+            self._index[field.name] = len(self._values)
+            self._values.append(field.value)
+            self._versions.append(0)
+            field._observer = self._synchronise
+        else:
+            field._observer = self._synchronise
+            self.set(field.name, field.value)
+
     def set(self, name, value):
         """
         Set the `value` of a given field (marked by `name`) in the model
         """
-        field = self._fields[name]
-        field.value = value
+        self._fields[name].value = value
+
+    def _synchronise(self, field: Field) -> None:
+        """
+        Mirror a write to `field` (whether made via `Model.set` or `Field.value`) into the model's 
+        own store, bumping its version
+        """
+        index = self._index[field.name]
+        self._values[index] = field.value
+        self._versions[index] += 1
 
     def get(self, name):
         """
         Get the `value` of a given field (marked by `name`) in the model
         """
-        field = self._fields[name]
         tracking = self._tracking
 
+        if name in self._pending:
+            self._resolve(name)
+            if self._initialised and name not in self._declared:
+                self._freeze_graph()
+
         if tracking.active:
             tracking.add_dependency(name)
             
-        return field.value
+        return self._values[self._index[name]]
+
+    def _resolve(self, field_name: str) -> None:
+        """
+        Compute a pending field for the first time
+        """
+        self._pending.discard(field_name)
+        self._build_dependencies(field_name)
 
     def _build_dependencies(self, field_name):
         """
         Build a dependency graph for a given `field_name`
         """
         field = self._fields[field_name]
-        tracking = self._tracking
+        value = _MISSING
+
+        if field_name in self._declared:
+            # Dependencies are already known (see `Model.register`) - only make sure that none of 
+            # them are still pending
+            for dep in self._upstream[field_name]:
+                if dep in self._pending:
+                    self._resolve(dep)
+            if field.from_task:
+                value = field.sentinel
+        else:
+            tracking = self._tracking
+
+            # Enable tracking
+            tracking.activate(field_name=field_name)
+
+            # Execute compute once to discover dependencies
+            value = field.convert(
+                self._call(
+                    field_name, 
+                    context={
+                        "from_task": field.from_task, 
+                        "sentinel": field.sentinel
+                    }
+                )
+            )
+
+            # Register reverse dependencies (de-duplicated, in the order they were first requested)
+            dependencies = tuple(dict.fromkeys(tracking.current_dependencies))
+            for dep in dependencies:
+                self._dependents[dep].append(field_name)
+            self._upstream[field_name] = dependencies
 
-        # Enable tracking
-        tracking.activate(field_name=field_name)
+            # Reset tracking
+            tracking.deactivate()
 
-        # Execute compute once to discover dependencies
-        value = field.compute(
-            model=self, 
-            context={
-                "from_task": field.from_task, 
-                "sentinel": field.sentinel
-            }
+        self._upstream_indices[field_name] = tuple(
+            self._index[dep] for dep in self._upstream[field_name]
         )
 
+        kernel = self._specialise(field_name)
+        if kernel is not None:
+            self._kernels[field_name] = kernel
+
+        # Task-driven fields only hold a placeholder at this point
+        if not field.from_task:
+            if value is _MISSING:
+                value = self._evaluate(field_name)
+            else:
+                self._remember(
+                    field_name, 
+                    self._dependency_versions(field_name), 
+                    self._cache_key(field_name), 
+                    value
+                )
+
         # Store value
-        field.value = value
+        self.set(field_name, value)
+
+    def _specialise(self, field_name: str) -> Callable[[], Any] | None:
+        """
+        Bind the (undecorated) compute function of `field_name` directly to the value slots of its
+        arguments - bypassing `with_model_context` altogether. Returns `None` for compute functions 
+        that cannot be specialised in this way
+        """
+        compute = self._fields[field_name].compute
+        func = getattr(compute, "__wrapped__", None)
+        if func is None or not getattr(compute, "positional", False):
+            return None
+
+        values = self._values
+        generator = self._generators.get(field_name)
+        slots = tuple(self._index.get(name) for name in compute.param_names)
+
+        if None not in slots:
+            def kernel():
+                return func(*[values[index] for index in slots])
+        elif generator is not None and slots.count(None) == 1:
+            def kernel():
+                return func(*[generator if index is None else values[index] for index in slots])
+        else:
+            return None
+
+        return kernel
+
+    def _call(self, field_name: str, **kwargs) -> Any:
+        """
+        Execute the compute function of `field_name` against the current state of the `model`
+        """
+        if not kwargs:
+            kernel = self._kernels.get(field_name)
+            if kernel is not None:
+                return kernel()
+
+        generator = self._generators.get(field_name)
+        if generator is not None:
+            kwargs["rng"] = generator
+        return self._fields[field_name].compute(model=self, **kwargs)
+
+    def _compute(self, field_name: str) -> Any:
+        """
+        Execute the compute function of `field_name`, coercing the result as the field itself would 
+        (e.g. to its `dtype`) - so that change detection, memoisation and each `delta` all see the 
+        value that is actually stored
+        """
+        return self._fields[field_name].convert(self._call(field_name))
+
+    def _evaluate(self, field_name: str, force: bool = False) -> Any:
+        """
+        Bring the value of `field_name` up to date with its upstream dependencies - reusing the 
+        current value if nothing upstream has been written to since the last evaluation (unless 
+        `force` is given), or else a memoised result where available. The new value is returned 
+        rather than stored
+        """
+        versions, key, value = self._recall(field_name, force)
+        if value is _MISSING:
+            value = self._compute(field_name)
+            self._remember(field_name, versions, key, value)
+        return value
+
+    async def _evaluate_async(self, field_name: str, force: bool = False) -> Any:
+        """
+        As `Model._evaluate`, except that the compute itself is dispatched to a worker thread - the
+        bookkeeping either side of it (versions, memoised and persisted results) stays on the 
+        event-loop thread
+        """
+        versions, key, value = self._recall(field_name, force)
+        if value is _MISSING:
+            value = await asyncio.to_thread(self._compute, field_name)
+            self._remember(field_name, versions, key, value)
+        return value
+
+    def _recall(self, field_name: str, force: bool) -> tuple[tuple[int, ...], Hashable | None, Any]:
+        """
+        Look for a value of `field_name` that spares a recompute - the current value if nothing 
+        upstream has been written to since the last evaluation (unless `force` is given), or else a 
+        memoised result. Returns the upstream versions, the memoisation key and the value found (or 
+        `_MISSING`)
+        """
+        versions = self._dependency_versions(field_name)
+        if not force and versions == self._evaluated.get(field_name):
+            return versions, None, self._values[self._index[field_name]]
+
+        key = self._cache_key(field_name)
+        value = self._cache_lookup(field_name, key)
+        if value is not _MISSING:
+            self._evaluated[field_name] = versions
+        return versions, key, value
+
+    def _remember(self, field_name: str, versions: tuple[int, ...], key: Hashable | None, value: Any) -> None:
+        """
+        Record a freshly computed `value` of `field_name` against the upstream `versions` (and `key`)
+        it was computed from
+        """
+        self._cache_store(field_name, key, value)
+        self._evaluated[field_name] = versions
+
+    def _dependency_versions(self, field_name: str) -> tuple[int, ...]:
+        """
+        Snapshot the current versions of the upstream dependencies of `field_name`
+        """
+        versions = self._versions
+        return tuple(versions[index] for index in self._upstream_indices[field_name])
 
-        # Register reverse dependencies
-        for dep in tracking.current_dependencies:
-            self._dependents[dep].append(field_name)
+    def _cache_key(self, field_name: str) -> Hashable | None:
+        """
+        Build the memoisation key for `field_name` from the current values of its upstream 
+        dependencies (or `None` if the field is neither memoised nor persisted, or if any of those 
+        values cannot be hashed)
+        """
+        field = self._fields[field_name]
+        if not (field.memoise or field.persist):
+            return None
+        try:
+            values = self._values
+            return tuple(
+                _hashable(values[index]) 
+                for index in self._upstream_indices[field_name]
+            )
+        except TypeError:
+            return None
 
-        # Reset tracking
-        tracking.deactivate()
+    def _cache_lookup(self, field_name: str, key: Hashable | None) -> Any:
+        """
+        Retrieve a memoised value for `field_name` (or `_MISSING` if there is none) - falling back
+        to the persisted results of `persist=True` fields. Arrays are returned as writeable copies, 
+        never as the (read-only) cache entry itself
+        """
+        if key is None:
+            return _MISSING
+        
+        cache = self._cache[field_name]
+        if key in cache:
+            cache.move_to_end(key)
+            value = cache[key]
+            return value.copy() if isinstance(value, np.ndarray) else value
+        
+        memoise = self._fields[field_name].memoise and self._cache_size > 0
+        if field_name not in self._fingerprints:
+            return _MISSING
+        
+        try:
+            with open(self._persisted_path(field_name, key), "rb") as file:
+                value = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return _MISSING
+        
+        if memoise:
+            cache[key] = _frozen(value)
+        return value
+
+    def _cache_store(self, field_name: str, key: Hashable | None, value: Any) -> None:
+        """
+        Memoise `value` for `field_name`, evicting the least recently used entry if necessary
+        """
+        if key is None:
+            return
+        
+        if field_name in self._fingerprints:
+            self._persist(field_name, key, value)
+        
+        if not self._fields[field_name].memoise or self._cache_size <= 0:
+            return
+        cache = self._cache[field_name]
+        cache[key] = _frozen(value)
+        cache.move_to_end(key)
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
+    def _persisted_path(self, field_name: str, key: Hashable) -> Path:
+        """
+        Locate the persisted result of `field_name` for a given memoisation `key`
+        """
+        digest = hashlib.sha256(
+            pickle.dumps((self._fingerprints[field_name], key), protocol=4)
+        ).hexdigest()
+        return self._cache_dir / field_name / f"{digest}.pkl"
+
+    def _persist(self, field_name: str, key: Hashable, value: Any) -> None:
+        """
+        Pickle `value` to disk (atomically, so that concurrent processes never read a partial file) - 
+        a failed write only costs the persisted copy, so it is reported rather than raised
+        """
+        path = self._persisted_path(field_name, key)
+        staging = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(staging, "wb") as file:
+                pickle.dump(value, file)
+            os.replace(staging, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+            try:
+                staging.unlink(missing_ok=True)
+            except OSError:
+                pass
+            warnings.warn(
+                f"Unable to persist the result of '{field_name}' to {path}: {error}", 
+                RuntimeWarning
+            )
 
     def initialise(self):
         """
         Initialise the `model` post field registration - in particular, register the upstream 
         (reverse) dependencies associated with every output field
         """
-        for name, field in self._fields.items():
-            if field.compute:
-                self._build_dependencies(name)
+        for name in self._declared:
+            self._upstream_indices[name] = tuple(
+                self._index[dep] for dep in self._upstream[name]
+            )
+        self._freeze_graph()
+
+        # Compute initial values in topological order (deferring `lazy=True` fields)
+        self._pending.update(name for name, field in self._fields.items() if field.compute)
+        for index in sorted(range(len(self._names)), key=self._rank.__getitem__):
+            name = self._names[index]
+            if name in self._pending and not self._fields[name].lazy:
+                self._resolve(name)
+
+        if not self._declared.issuperset(self._upstream):
+            self._freeze_graph()
+        self._initialised = True
+
+    def _freeze_graph(self) -> None:
+        """
+        Derive the (slot-addressed) adjacency, topological order and depths of the dependency graph
+        """
+        # Freeze the graph into adjacency tuples addressed by value slot (i.e. `Model._index`)
+        self._names = tuple(self._index)
+        self._successors = tuple(
+            tuple(self._index[dep] for dep in self._dependents.get(name, ()))
+            for name in self._names
+        )
+        self._predecessors = tuple(
+            self._upstream_indices.get(name, ())
+            for name in self._names
+        )
+
+        # Fix a topological order for the graph so that refreshes can sweep it linearly
+        graph = {index: predecessors for index, predecessors in enumerate(self._predecessors)}
+        order = tuple(TopologicalSorter(graph).static_order())
+        self._rank = [0] * len(order)
+        for rank, index in enumerate(order):
+            self._rank[index] = rank
+
+        # Fields at the same depth are independent of one another (see `Model.refresh_async`)
+        self._depth = [0] * len(order)
+        for index in order:
+            self._depth[index] = 1 + max(
+                (self._depth[dep] for dep in self._predecessors[index]), 
+                default=-1
+            )
+
+    def _downstream(self, index: int) -> list[int]:
+        """
+        Collect the slot of every field reachable from slot `index` in the dependency graph, in 
+        topological order
+        """
+        successors = self._successors
+        if index >= len(successors):
+            # Not yet part of the frozen graph (registered since, or prior to, `Model.initialise`)
+            return []
+
+        reachable = set()
+        stack = list(successors[index])
+
+        while stack:
+            index = stack.pop()
+            if index not in reachable:
+                reachable.add(index)
+                stack.extend(successors[index])
+
+        return sorted(reachable, key=self._rank.__getitem__)
 
     async def refresh_task(self, output_name: str) -> dict[str, Any]:
         """
         Refresh a 'task output' field
 
+        The task is always recomputed, even if none of its inputs have changed since it was last run 
+        (so e.g. a task drawing from `rng` yields a fresh sample on each call). Results memoised or 
+        persisted for the same inputs are still reused
+
         :param output_name: the name of the task-driven output (this must have `Field.from_task == True`)
         :return: a dictionary object containing key-value pairs for 'modified' output fields
         """
@@ -149,11 +634,11 @@ class Model:
         if not field.from_task:
             raise ValueError(f"Incorrect specification; '{output_name}' is not a task-driven field")
         
-        new_value = await asyncio.to_thread(
-            field.compute,
-            model=self
-        )
-        field.value = new_value
+        if output_name in self._pending:
+            self.get(output_name)
+
+        new_value = await self._evaluate_async(output_name, force=True)
+        self.set(output_name, new_value)
 
         delta[output_name] = new_value
         delta.update(
@@ -175,32 +660,110 @@ class Model:
         :return: a dictionary object containing key-value pairs for 'modified' output fields
         """
         delta = {}
-        queue = deque(self._dependents[input_name])
+        input_index = self._index[input_name]
+        changed = bytearray(len(self._values))
+        changed[input_index] = True
+        self.set(input_name, input_value)
 
-        while queue:
-            output_name = queue.popleft()
+        for output_index in self._downstream(input_index):
+
+            # Only outputs with (at least one) modified upstream dependency need recomputing
+            if not any(changed[dep] for dep in self._predecessors[output_index]):
+                continue
+
+            output_name = self._names[output_index]
             output_field = self._fields[output_name]
 
+            # Deferred fields are computed afresh upon their first read
+            if output_name in self._pending:
+                continue
+
             if output_field.from_task:
-                queue.extend(self._dependents[output_name])
+                changed[output_index] = True
                 continue
             
-            old_value = output_field.value
-            self.set(input_name, input_value)
-            new_value = output_field.compute(model=self)
+            old_value = self._values[output_index]
+            new_value = self._evaluate(output_name)
             
-            delta_condition = False
-            if isinstance(output_field, Array):
-                delta_condition = not np.array_equal(old_value, new_value)
-            else:
-                delta_condition = (new_value != old_value)
-
-            if delta_condition:
-                output_field.value = new_value
+            if self._has_changed(output_field, old_value, new_value):
+                self.set(output_name, new_value)
                 delta[output_name] = new_value
-                queue.extend(self._dependents[output_name])
+                changed[output_index] = True
+
+        return delta
+
+    async def refresh_async(self, input_name: str, input_value: Any) -> dict[str, Any]:
+        """
+        Refresh all downstream outputs in the `model` that are associated with the input 
+        specified by `input_name` - unlike `Model.refresh`, this includes task-driven fields
+
+        Outputs are processed layer by layer (in topological order) and every output within a 
+        layer that requires recomputing is dispatched to its own thread, so that independent 
+        (CPU-bound) computations may run concurrently
+
+        :param input_name: the name of the affected input field
+        :param input_value: the new value of the affected input field
+        :return: a dictionary object containing key-value pairs for 'modified' output fields
+        """
+        delta = {}
+        input_index = self._index[input_name]
+        changed = bytearray(len(self._values))
+        changed[input_index] = True
+        self.set(input_name, input_value)
+
+        layers = defaultdict(list)
+        for output_index in self._downstream(input_index):
+            layers[self._depth[output_index]].append(output_index)
+
+        for depth in sorted(layers):
+
+            stale = [
+                self._names[output_index]
+                for output_index in layers[depth]
+                if any(changed[dep] for dep in self._predecessors[output_index])
+                and self._names[output_index] not in self._pending
+            ]
+
+            # Fields within a layer never read one another, so each may be computed in its own thread
+            results = await asyncio.gather(*(
+                self._evaluate_async(output_name)
+                for output_name in stale
+            ))
+
+            for output_name, new_value in zip(stale, results):
+                output_field = self._fields[output_name]
+                output_index = self._index[output_name]
+                old_value = self._values[output_index]
+                if self._has_changed(output_field, old_value, new_value):
+                    self.set(output_name, new_value)
+                    delta[output_name] = new_value
+                    changed[output_index] = True
 
         return delta
+
+    @staticmethod
+    def _has_changed(field: Field, old_value: Any, new_value: Any) -> bool:
+        """
+        Determine whether the `value` of a given `field` differs following a recompute - arrays are 
+        compared block by block so that the comparison stops at the first mismatching block 
+        """
+        if old_value is new_value:
+            return False
+        
+        if isinstance(field, Array):
+            old_value = np.asarray(old_value)
+            new_value = np.asarray(new_value)
+            if old_value.shape != new_value.shape:
+                return True
+            old_value = old_value.ravel()
+            new_value = new_value.ravel()
+            for start in range(0, new_value.size, _BLOCK_SIZE):
+                stop = start + _BLOCK_SIZE
+                if not np.array_equal(old_value[start:stop], new_value[start:stop]):
+                    return True
+            return False
+        
+        return (new_value != old_value)
     
     def __repr__(self):
         field_header = "---- Fields ----\n\n"
@@ -1,14 +1,17 @@
 class Tracking:
 
+    __slots__ = ("_active", "_current_field", "_current_dependencies", "_suspended")
+
     def __init__(
         self, 
         active: bool = False, 
         current_field: str | None = None, 
-        current_dependencies: set = set()
+        current_dependencies: list | None = None
     ):
         self._active = active
         self._current_field = current_field
-        self._current_dependencies = current_dependencies
+        self._current_dependencies = list(current_dependencies) if current_dependencies is not None else []
+        self._suspended = []
 
     @property
     def active(self):
@@ -19,14 +22,21 @@ class Tracking:
         return self._current_dependencies
 
     def activate(self, field_name: str):
+        # Tracking may be nested (e.g. a deferred field computed on demand) - suspend the outer field
+        if self._active:
+            self._suspended.append((self._current_field, self._current_dependencies))
+            self._current_dependencies = []
         self._active = True
         self._current_field = field_name
     
     def deactivate(self):
+        if self._suspended:
+            self._current_field, self._current_dependencies = self._suspended.pop()
+            return
         self._active = False
         self._current_field = None
-        self._current_dependencies = set()
+        self._current_dependencies = []
 
     def add_dependency(self, field_name: str):
-        self._current_dependencies.add(field_name)
-    
\ No newline at end of file
+        self._current_dependencies.append(field_name)
+    
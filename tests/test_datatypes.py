@@ -64,6 +64,21 @@ def test_basic_array_instantiation():
     )
 
 
+def test_typed_array_instantiation():
+
+    typed_array = Array(
+        name="typed_array",
+        default_value=[1.0, 2.0, 3.0],
+        dtype=np.float32
+    )
+
+    assert typed_array.value.dtype == np.float32
+
+    typed_array.value = np.array([4.0, 5.0])
+
+    assert typed_array.value.dtype == np.float32
+
+
 def test_basic_list_instantiation():
 
     basic_list = List(
@@ -80,5 +95,18 @@ def test_basic_list_instantiation():
 
 
 
+def test_slotted_fields():
+
+    fields = [
+        Float(name="float_field"),
+        Array(name="array_field"),
+        List(name="list_field", default_value=[])
+    ]
+
+    for field in fields:
+        assert not hasattr(field, "__dict__")
+
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,5 +1,10 @@
 import pytest
+import asyncio
+import threading
 import numpy as np
+from tarsiflow import with_model_context, Model
+from tarsiflow.model import _fingerprint
+from tarsiflow.datatypes import Float, Integer, Array
 
 
 def test_model_dependencies(sample_model):
@@ -12,6 +17,14 @@ def test_model_dependencies(sample_model):
     assert dependents["z"] == ["w"]
 
 
+def test_declared_dependencies(sample_operations):
+
+    model = Model()
+    model.register(Float("x", sample_operations["compute_x"]))
+
+    assert model.dependents["a"] == ["x"]
+
+
 def test_model_refresh(sample_model):
 
     delta = sample_model.refresh(
@@ -35,5 +48,434 @@ def test_zero_refresh(sample_model):
     assert delta["x"] == 0
 
 
+def test_field_writes(sample_model):
+
+    sample_model.fields["a"].value = 5.00
+
+    assert sample_model.get("a") == 5.00
+    assert sample_model.refresh("a", 5.00) == {"x": 10.00}
+
+
+def test_independent_refresh():
+
+    model = Model()
+    model.register(Float("a", default_value=1.00))
+    model.register(Float("k", default_value=1.00))
+    model.initialise()
+
+    delta = model.refresh("k", 3.00)
+
+    assert delta == {}
+    assert model.get("k") == 3.00
+
+
+def test_uninitialised_refresh(sample_operations):
+
+    model = Model()
+    model.register(Float("a", default_value=1.00))
+    model.register(Float("x", sample_operations["compute_x"]))
+
+    assert model.refresh("a", 2.00) == {}
+
+    model.initialise()
+    model.register(Float("k", default_value=1.00))
+
+    assert model.refresh("k", 2.00) == {}
+    assert asyncio.run(model.refresh_async("k", 3.00)) == {}
+
+
+def test_memoised_refresh():
+
+    calls = []
+
+    @with_model_context
+    def compute_x(
+        a: float
+    ) -> float:
+        calls.append(a)
+        return a * 2
+    
+    model = Model()
+    model.register(Float("a", default_value=1.00))
+    model.register(Float("x", compute_x, memoise=True))
+    model.initialise()
+
+    model.refresh("a", 2.00)
+    delta = model.refresh("a", 1.00)
+
+    assert delta["x"] == 2.00
+    assert calls == [1.00, 2.00]
+
+
+def test_memoised_values_isolated():
+
+    @with_model_context
+    def compute_z(
+        c: float
+    ) -> np.ndarray:
+        return np.array([c, c * 2])
+    
+    model = Model()
+    model.register(Float("c", default_value=1.00))
+    model.register(Array("z", compute_z, memoise=True))
+    model.initialise()
+
+    delta = model.refresh("c", 6.00)
+    delta["z"][0] = -999.00
+    model.refresh("c", 1.00)
+    delta = model.refresh("c", 6.00)
+
+    np.testing.assert_array_equal(model.get("z"), [6.00, 12.00])
+    np.testing.assert_array_equal(delta["z"], [6.00, 12.00])
+    assert delta["z"].flags.writeable
+
+
+def test_memoised_keys():
+
+    @with_model_context
+    def compute_x(
+        a: float
+    ) -> float:
+        return 1 / a if a else np.copysign(np.inf, a)
+    
+    @with_model_context
+    def compute_t(
+        items: np.ndarray
+    ) -> float:
+        return float(sum(item[0] for item in items))
+    
+    items = np.empty(1, dtype=object)
+    items[0] = [1.00]
+
+    model = Model()
+    model.register(Float("a", default_value=0.00))
+    model.register(Float("x", compute_x, memoise=True))
+    model.register(Array("items", default_value=items))
+    model.register(Float("t", compute_t, memoise=True))
+    model.initialise()
+
+    assert model.refresh("a", -0.00)["x"] == -np.inf
+
+    items[0][0] = 5.00
+    model.refresh("items", items)
+
+    assert model.get("t") == 5.00
+
+
+def test_persisted_compute(tmp_path):
+
+    calls = []
+
+    @with_model_context
+    def compute_x(
+        a: float
+    ) -> float:
+        calls.append(a)
+        return a * 2
+    
+    def build():
+        model = Model(cache_dir=tmp_path)
+        model.register(Float("a", default_value=1.00))
+        model.register(Float("x", compute_x, persist=True))
+        model.initialise()
+        return model
+    
+    first = build()
+    first.refresh("a", 2.00)
+    written = {path: path.stat().st_ino for path in tmp_path.rglob("*.pkl")}
+    second = build()
+    delta = second.refresh("a", 2.00)
+
+    assert second.get("x") == 4.00
+    assert delta == {"x": 4.00}
+    assert second.dependents["a"] == ["x"]
+    assert calls == [1.00, 2.00]
+    assert {path: path.stat().st_ino for path in tmp_path.rglob("*.pkl")} == written
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_persisted_fingerprints():
+
+    source = "def compute_x(a):\n    return a * {}\n"
+
+    def define(factor, filename, offset=0):
+        namespace = {}
+        exec(compile("\n" * offset + source.format(factor), filename, "exec"), namespace)
+        return namespace["compute_x"]
+    
+    fingerprint = _fingerprint(define(2, "first.py"))
+
+    assert _fingerprint(define(2, "second.py", offset=10)) == fingerprint
+    assert _fingerprint(define(3, "first.py")) != fingerprint
+
+
+def test_persisted_failures(tmp_path):
+
+    @with_model_context
+    def compute_x(
+        a: float
+    ) -> float:
+        return a * 2
+    
+    blocker = tmp_path / "blocker"
+    blocker.touch()
+
+    model = Model(cache_dir=blocker / "cache")
+    model.register(Float("a", default_value=1.00))
+    model.register(Float("x", compute_x, persist=True))
+
+    with pytest.warns(RuntimeWarning):
+        model.initialise()
+    with pytest.warns(RuntimeWarning):
+        delta = model.refresh("a", 2.00)
+
+    assert delta == {"x": 4.00}
+
+    with pytest.raises(ValueError):
+        model.register(Float("k", default_value=1.00, persist=True))
+
+
+def test_lazy_compute():
+
+    calls = []
+
+    @with_model_context
+    def compute_x(
+        a: float
+    ) -> float:
+        calls.append(a)
+        return a * 2
+    
+    @with_model_context
+    def compute_y(
+        b: float
+    ) -> float:
+        return b * 3
+    
+    @with_model_context
+    def compute_z(
+        y: float
+    ) -> float:
+        return y + 1
+    
+    model = Model()
+    model.register(Float("a", default_value=1.00))
+    model.register(Float("b", default_value=1.00))
+    model.register(Float("x", compute_x, lazy=True))
+    model.register(Float("z", compute_z))
+    model.register(Float("y", compute_y, lazy=True))
+    model.initialise()
+
+    assert calls == []
+    assert model.dependents["a"] == ["x"]
+    assert model.get("z") == 4.00
+
+    delta = model.refresh("a", 3.00)
+
+    assert delta == {}
+    assert calls == []
+    assert model.get("x") == 6.00
+
+    delta = model.refresh("a", 2.00)
+
+    assert delta == {"x": 4.00}
+    assert calls == [3.00, 2.00]
+
+
+def test_diamond_refresh():
+
+    calls = []
+
+    @with_model_context
+    def compute_x(
+        a: float
+    ) -> float:
+        return a + 1
+    
+    @with_model_context
+    def compute_y(
+        a: float
+    ) -> float:
+        return a + 2
+    
+    @with_model_context
+    def compute_z(
+        x: float,
+        y: float
+    ) -> float:
+        calls.append((x, y))
+        return x * y
+    
+    model = Model()
+    model.register(Float("a", default_value=1.00))
+    model.register(Float("x", compute_x))
+    model.register(Float("y", compute_y))
+    model.register(Float("z", compute_z))
+    model.initialise()
+
+    delta = model.refresh("a", 2.00)
+
+    assert delta == {"x": 3.00, "y": 4.00, "z": 12.00}
+    assert calls[-1] == (3.00, 4.00)
+    assert len(calls) == 2
+
+
+def test_unchanged_dependencies_refresh():
+
+    calls = []
+
+    @with_model_context
+    def compute_t(
+        a: float
+    ) -> float:
+        return a * 2
+    
+    @with_model_context
+    def compute_u(
+        t: float,
+        k: float
+    ) -> float:
+        calls.append((t, k))
+        return t + k
+    
+    model = Model(cache_size=0)
+    model.register(Float("a", default_value=1.00))
+    model.register(Float("k", default_value=1.00))
+    model.register(Float("t", compute_t, from_task=True))
+    model.register(Float("u", compute_u))
+    model.initialise()
+
+    delta = model.refresh("a", 2.00)
+
+    assert delta == {}
+    assert len(calls) == 1
+
+
+def test_array_change_detection(sample_model):
+
+    field = sample_model.fields["z"]
+    old_value = np.zeros(200_000)
+    new_value = old_value.copy()
+
+    assert not Model._has_changed(field, old_value, old_value)
+    assert not Model._has_changed(field, old_value, new_value)
+
+    new_value[-1] = 1.00
+
+    assert Model._has_changed(field, old_value, new_value)
+    assert Model._has_changed(field, old_value, new_value[:-1])
+    assert Model._has_changed(field, np.zeros((2, 3)), np.zeros((3, 2)))
+
+
+def test_typed_array_refresh():
+
+    @with_model_context
+    def compute_z(
+        a: float
+    ) -> np.ndarray:
+        return np.full(2, 0.1 if a < 3 else a / 10)
+    
+    model = Model()
+    model.register(Float("a", default_value=1.00))
+    model.register(Array("z", compute_z, dtype=np.float32))
+    model.initialise()
+
+    assert model.refresh("a", 2.00) == {}
+
+    delta = model.refresh("a", 5.00)
+
+    assert delta["z"].dtype == np.float32
+    assert model.get("z").dtype == np.float32
+
+
+def test_seeded_generators():
+
+    @with_model_context
+    def compute_noise(
+        n: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        return rng.standard_normal(n)
+    
+    def build(seed):
+        model = Model(seed=seed)
+        model.register(Integer("n", default_value=3))
+        model.register(Array("noise", compute_noise))
+        model.initialise()
+        return model
+    
+    first, second = build(seed=42), build(seed=42)
+
+    assert first.dependents["n"] == ["noise"]
+    np.testing.assert_array_equal(first.get("noise"), second.get("noise"))
+    np.testing.assert_array_equal(
+        first.refresh("n", 5)["noise"], 
+        second.refresh("n", 5)["noise"]
+    )
+
+
+def test_repeated_task_refresh():
+
+    @with_model_context
+    def compute_sample(
+        n: int,
+        rng: np.random.Generator
+    ) -> np.ndarray:
+        return rng.standard_normal(n)
+    
+    model = Model(seed=42)
+    model.register(Integer("n", default_value=3))
+    model.register(Array("sample", compute_sample, from_task=True))
+    model.initialise()
+
+    first = asyncio.run(model.refresh_task("sample"))["sample"]
+    second = asyncio.run(model.refresh_task("sample"))["sample"]
+
+    assert not np.array_equal(first, second)
+
+
+def test_async_refresh(sample_model):
+
+    delta = asyncio.run(
+        sample_model.refresh_async(
+            "b",
+            5
+        )
+    )
+
+    assert delta["y"] == 10
+
+
+def test_async_bookkeeping(monkeypatch):
+
+    threads = []
+    cache_store = Model._cache_store
+
+    def record(self, *args):
+        threads.append(threading.current_thread())
+        cache_store(self, *args)
+
+    @with_model_context
+    def compute_x(
+        a: float
+    ) -> float:
+        threads.append(threading.current_thread())
+        return a * 2
+    
+    monkeypatch.setattr(Model, "_cache_store", record)
+
+    model = Model()
+    model.register(Float("a", default_value=1.00))
+    model.register(Float("x", compute_x, memoise=True))
+    model.initialise()
+    threads.clear()
+
+    delta = asyncio.run(model.refresh_async("a", 2.00))
+
+    assert delta == {"x": 4.00}
+    assert threads[0] is not threading.main_thread()
+    assert threads[1] is threading.main_thread()
+
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
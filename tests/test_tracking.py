@@ -0,0 +1,48 @@
+import pytest
+from tarsiflow.tracking import Tracking
+
+
+def test_independent_instances():
+
+    first = Tracking()
+    second = Tracking()
+
+    first.activate("x")
+    first.add_dependency("a")
+
+    assert first.current_dependencies == ["a"]
+    assert second.current_dependencies == []
+
+
+def test_deactivate_resets_dependencies():
+
+    tracking = Tracking()
+
+    tracking.activate("x")
+    tracking.add_dependency("a")
+    tracking.add_dependency("a")
+    tracking.deactivate()
+
+    assert not tracking.active
+    assert tracking.current_dependencies == []
+
+
+def test_nested_tracking():
+
+    tracking = Tracking()
+
+    tracking.activate("x")
+    tracking.add_dependency("a")
+    tracking.activate("y")
+    tracking.add_dependency("b")
+
+    assert tracking.current_dependencies == ["b"]
+
+    tracking.deactivate()
+
+    assert tracking.active
+    assert tracking.current_dependencies == ["a"]
+
+
+if __name__ == "__main__":
+    pytest.main()